@@ -1,12 +1,16 @@
 import os
 import re
 import logging
-from datetime import datetime, date
+from datetime import datetime, date, timezone
+from functools import lru_cache
+from cachetools import TTLCache
 from telegram import Update, BotCommand
 from telegram.ext import Application, CommandHandler, MessageHandler, ContextTypes, filters
-from supabase import create_client
+from postgrest import APIError
+from supabase import acreate_client
 
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING"))
+logging.getLogger("httpx").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 # --- Config ---
@@ -16,11 +20,25 @@ SUPABASE_KEY = os.environ["SUPABASE_KEY"]
 WEBHOOK_URL = os.environ.get("WEBHOOK_URL", "")
 PORT = int(os.environ.get("PORT", 10000))
 
-sb = create_client(SUPABASE_URL, SUPABASE_KEY)
+# Async client so DB round-trips don't block the event loop; created in
+# post_init once the loop is running.
+sb = None
 
 # --- Priority Tag Values ---
 TAG_VALUES = {"FGR": 3, "CETS": 3, "CS": 2}
 
+# --- Compiled patterns (one-time FSM construction, no re-cache lookups) ---
+# Single alternation so one finditer pass extracts every field.
+_RE_FIELDS = re.compile(
+    r"@(?P<tag>\S+)"
+    r"|\|e\s*(?P<proj>\S+)"
+    r"|\|p\s*(?P<pri_u>[UN])\s*(?P<pri_n>\d)"
+    r"|\|f\s*(?P<date>\d{6})",
+    re.IGNORECASE | re.ASCII,
+)
+# /show argument forms: "@TAG", "p PROYECTO", or free text (project search).
+_RE_SHOW = re.compile(r"@(?P<tag>\S+)|p\s+(?P<proj>.+)|(?P<free>.+)", re.IGNORECASE | re.DOTALL)
+
 # --- Helpers ---
 
 def parse_task(text: str) -> dict:
@@ -31,49 +49,47 @@ def parse_task(text: str) -> dict:
     priority_str = None
     date_str = None
 
-    # Extract @tag
-    m = re.search(r"@(\S+)", raw)
-    if m:
-        tag = m.group(1).upper()
-        raw = raw[:m.start()] + raw[m.end():]
-
-    # Extract |e project
-    m = re.search(r"\|e\s*(\S+)", raw, re.IGNORECASE)
-    if m:
-        project = m.group(1)
-        raw = raw[:m.start()] + raw[m.end():]
-
-    # Extract |p priority (e.g. U2, N3, U1)
-    m = re.search(r"\|p\s*([UuNn])\s*(\d)", raw)
-    if m:
-        priority_str = m.group(1).upper() + m.group(2)
-        raw = raw[:m.start()] + raw[m.end():]
-
-    # Extract |f date (ddmmyy)
-    m = re.search(r"\|f\s*(\d{6})", raw)
-    if m:
-        date_str = m.group(1)
-        raw = raw[:m.start()] + raw[m.end():]
-
-    title = re.sub(r"\s+", " ", raw).strip()
+    # One pass: collect fields, keep the unmatched spans for the title.
+    pieces = []
+    last_end = 0
+    for m in _RE_FIELDS.finditer(raw):
+        if m.group("tag"):
+            tag = m.group("tag").upper()
+        elif m.group("proj"):
+            project = m.group("proj")
+        elif m.group("pri_u"):
+            priority_str = m.group("pri_u").upper() + m.group("pri_n")
+        else:
+            date_str = m.group("date")
+        pieces.append(raw[last_end:m.start()])
+        last_end = m.end()
+    pieces.append(raw[last_end:])
+
+    title = " ".join("".join(pieces).split())
     return {"title": title, "tag": tag, "project": project, "priority_str": priority_str, "date_str": date_str}
 
 
-def calc_date_value(date_str: str | None) -> int:
-    if not date_str:
-        return 0
+# Urgency by days-until-due, indexed by delta+3 saturated at both ends:
+# overdue/<=3 days -> 3, 4-15 days -> 2, beyond -> 1.
+_DATE_LUT = (3,) * 7 + (2,) * 12 + (1,)
+
+
+@lru_cache(maxsize=1024)
+def _date_ordinal(date_str: str) -> int | None:
+    """Ordinal for a ddmmyy string, parsed once per distinct value."""
     try:
-        d = datetime.strptime(date_str, "%d%m%y").date()
-        delta = (d - date.today()).days
-        if delta <= 0:
-            return 3  # overdue = max urgency
-        if delta <= 3:
-            return 3
-        if delta <= 15:
-            return 2
-        return 1
+        return date(int(date_str[4:6]) + 2000, int(date_str[2:4]), int(date_str[:2])).toordinal()
     except ValueError:
+        return None
+
+
+def calc_date_value(date_str: str | None, today_ord: int) -> int:
+    if not date_str:
         return 0
+    due_ord = _date_ordinal(date_str)
+    if due_ord is None:
+        return 0
+    return _DATE_LUT[max(0, min(due_ord - today_ord + 3, 19))]
 
 
 def calc_priority_value(priority_str: str | None) -> int:
@@ -84,21 +100,18 @@ def calc_priority_value(priority_str: str | None) -> int:
     return urgency + num
 
 
-def calc_total_score(tag: str | None, priority_str: str | None, date_str: str | None) -> int:
+@lru_cache(maxsize=4096)
+def calc_total_score(tag: str | None, priority_str: str | None, date_str: str | None, today_ord: int) -> int:
     tag_val = TAG_VALUES.get(tag, 0) if tag else 0
-    return tag_val + calc_priority_value(priority_str) + calc_date_value(date_str)
+    return tag_val + calc_priority_value(priority_str) + calc_date_value(date_str, today_ord)
 
 
-def next_available_id(user_id: int) -> int:
-    """Find smallest available ID (1-99) for user."""
-    rows = sb.table("tasks").select("task_id").eq("user_id", user_id).execute().data
-    used = {r["task_id"] for r in rows}
-    for i in range(1, 100):
-        if i not in used:
-            return i
-    return 99
+def _parse_id(s: str) -> int | None:
+    """Validate a 1-99 task id argument without paying for an exception."""
+    return int(s) if s.isdecimal() and 0 < int(s) < 100 else None
 
 
+@lru_cache(maxsize=1024)
 def format_date(date_str: str | None) -> str:
     if not date_str:
         return ""
@@ -111,32 +124,96 @@ def format_date(date_str: str | None) -> str:
 
 def format_task(t: dict, idx: int) -> str:
     """Format a task for display. idx = visual position."""
-    parts = [f"{idx}. [{t['task_id']}] {t['title']}"]
-    if t.get("tag"):
-        parts.append(f"@{t['tag']}")
-    if t.get("project"):
-        parts.append(f"|e {t['project']}")
-    if t.get("priority_str"):
-        parts.append(f"|p {t['priority_str']}")
-    if t.get("date_str"):
-        parts.append(f"📅{format_date(t['date_str'])}")
-    return " ".join(parts)
-
-
-def get_tasks(user_id: int, tag: str = None, project: str = None) -> list[dict]:
-    """Get tasks sorted by score desc."""
-    q = sb.table("tasks").select("*").eq("user_id", user_id).eq("done", False)
+    return (
+        f"{idx}. [{t['task_id']}] {t['title']}"
+        f"{' @' + t['tag'] if t.get('tag') else ''}"
+        f"{' |e ' + t['project'] if t.get('project') else ''}"
+        f"{' |p ' + t['priority_str'] if t.get('priority_str') else ''}"
+        f"{' 📅' + format_date(t['date_str']) if t.get('date_str') else ''}"
+    )
+
+
+# Open-task lists per user; any write from the user invalidates their entry.
+_task_cache = TTLCache(maxsize=10_000, ttl=30)
+
+
+def _invalidate_tasks(user_id: int):
+    _task_cache.pop(user_id, None)
+
+
+# Used ids as a bitmask: bit i set means id i is taken. Bit 0 is reserved
+# so the lowest free bit always lands in 1..99.
+_ALL_IDS = (1 << 100) - 2
+
+
+async def _load_used_mask(ctx: ContextTypes.DEFAULT_TYPE, user_id: int) -> int:
+    """Get the cached bitmask of task_ids in use by this user, loading it once."""
+    key = f"used_{user_id}"
+    mask = ctx.bot_data.get(key)
+    if mask is None:
+        rows = (await sb.table("tasks").select("task_id").eq("user_id", user_id).eq("done", False).execute()).data
+        mask = 0
+        for r in rows:
+            mask |= 1 << r["task_id"]
+        ctx.bot_data[key] = mask
+    return mask
+
+
+async def next_available_id(ctx: ContextTypes.DEFAULT_TYPE, user_id: int) -> int:
+    """Find smallest available ID (1-99) for user."""
+    mask = await _load_used_mask(ctx, user_id)
+    free = ~mask & _ALL_IDS
+    task_id = (free & -free).bit_length() - 1 if free else 99
+    ctx.bot_data[f"used_{user_id}"] = mask | (1 << task_id)
+    return task_id
+
+
+def _claim_id(ctx: ContextTypes.DEFAULT_TYPE, user_id: int, task_id: int):
+    key = f"used_{user_id}"
+    mask = ctx.bot_data.get(key)
+    if mask is not None:
+        ctx.bot_data[key] = mask | (1 << task_id)
+
+
+def _release_id(ctx: ContextTypes.DEFAULT_TYPE, user_id: int, task_id: int):
+    key = f"used_{user_id}"
+    mask = ctx.bot_data.get(key)
+    if mask is not None:
+        ctx.bot_data[key] = mask & ~(1 << task_id)
+
+
+async def _set_undo(user_id: int, payload: dict):
+    """Record the user's last undoable action (one row per user, see schema.sql)."""
+    await sb.table("undo_log").upsert({
+        "user_id": user_id,
+        "payload": payload,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }).execute()
+
+
+async def _get_undo(user_id: int) -> dict | None:
+    res = await sb.table("undo_log").select("payload").eq("user_id", user_id).execute()
+    return res.data[0]["payload"] if res.data else None
+
+
+async def _clear_undo(user_id: int):
+    await sb.table("undo_log").delete().eq("user_id", user_id).execute()
+
+
+async def get_tasks(user_id: int, tag: str = None, project: str = None) -> list[dict]:
+    """Get tasks sorted by score desc (scored in Postgres, see schema.sql)."""
+    rows = _task_cache.get(user_id)
+    if rows is None:
+        q = sb.table("tasks").select("id,task_id,title,tag,project,priority_str,date_str").eq("user_id", user_id).eq("done", False)
+        rows = (await q.order("score", desc=True).execute()).data
+        _task_cache[user_id] = rows
     if tag:
-        q = q.eq("tag", tag.upper())
+        tag = tag.upper()
+        return [r for r in rows if r.get("tag") == tag]
     if project:
-        q = q.ilike("project", f"%{project}%")
-    rows = q.execute().data
-
-    # Recalculate scores (date value changes daily)
-    for r in rows:
-        r["_score"] = calc_total_score(r.get("tag"), r.get("priority_str"), r.get("date_str"))
-    rows.sort(key=lambda x: x["_score"], reverse=True)
-    return rows
+        needle = project.lower()
+        return [r for r in rows if needle in (r.get("project") or "").lower()]
+    return list(rows)
 
 
 # --- Handlers ---
@@ -194,15 +271,12 @@ async def cmd_show(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
     tag = project = None
 
     if args:
-        text = " ".join(args)
-        if text.startswith("@"):
-            tag = text[1:]
-        elif text.lower().startswith("p "):
-            project = text[2:].strip()
-        else:
-            project = text  # fallback: treat as project search
+        m = _RE_SHOW.match(" ".join(args))
+        if m:
+            tag = m.group("tag")
+            project = m.group("proj") or m.group("free")
 
-    tasks = get_tasks(user_id, tag=tag, project=project)
+    tasks = await get_tasks(user_id, tag=tag, project=project)
     if not tasks:
         label = ""
         if tag:
@@ -212,19 +286,29 @@ async def cmd_show(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text(f"📭 No hay tareas{label}.")
         return
 
-    lines = []
     header = "📋 *Tareas*"
     if tag:
         header += f" @{tag.upper()}"
     if project:
         header += f" — {project}"
-    lines.append(header)
-    lines.append("")
 
-    for i, t in enumerate(tasks, 1):
-        lines.append(format_task(t, i))
+    text = header + "\n\n" + "\n".join(format_task(t, i) for i, t in enumerate(tasks, 1))
+    if len(text) <= 4000:
+        await update.message.reply_text(text, parse_mode="Markdown")
+        return
 
-    await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
+    # Telegram caps messages at 4096 chars; split on line boundaries.
+    chunks, buf, size = [], [], 0
+    for line in text.split("\n"):
+        if buf and size + len(line) + 1 > 4000:
+            chunks.append("\n".join(buf))
+            buf, size = [], 0
+        buf.append(line)
+        size += len(line) + 1
+    chunks.append("\n".join(buf))
+    # Sequential sends: concurrent ones can arrive out of order.
+    for c in chunks:
+        await update.message.reply_text(c, parse_mode="Markdown")
 
 
 async def cmd_done(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
@@ -234,31 +318,38 @@ async def cmd_done(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
         return
 
     if ctx.args[0].lower() == "all":
-        tasks = get_tasks(user_id)
-        if not tasks:
+        # Write directly; the returned rows carry everything undo needs.
+        res = await sb.table("tasks").update({"done": True}).eq("user_id", user_id).eq("done", False).execute()
+        if not res.data:
             await update.message.reply_text("📭 No hay tareas pendientes.")
             return
-        for t in tasks:
-            sb.table("tasks").update({"done": True}).eq("id", t["id"]).execute()
+        _invalidate_tasks(user_id)
+        for t in res.data:
+            _release_id(ctx, user_id, t["task_id"])
         # Store undo
-        ctx.bot_data[f"undo_{user_id}"] = {"action": "done_all", "task_ids": [t["id"] for t in tasks]}
-        await update.message.reply_text(f"✅ {len(tasks)} tareas completadas.")
+        await _set_undo(user_id, {
+            "action": "done_all",
+            "row_ids": [t["id"] for t in res.data],
+            "task_ids": [t["task_id"] for t in res.data],
+        })
+        await update.message.reply_text(f"✅ {len(res.data)} tareas completadas.")
         return
 
-    try:
-        task_id = int(ctx.args[0])
-    except ValueError:
+    task_id = _parse_id(ctx.args[0])
+    if task_id is None:
         await update.message.reply_text("ID debe ser un número.")
         return
 
-    row = sb.table("tasks").select("*").eq("user_id", user_id).eq("task_id", task_id).eq("done", False).execute().data
-    if not row:
+    # Single round-trip: PostgREST returns the updated row, so no prior SELECT.
+    res = await sb.table("tasks").update({"done": True}).eq("user_id", user_id).eq("task_id", task_id).eq("done", False).execute()
+    if not res.data:
         await update.message.reply_text(f"❌ Tarea #{task_id} no encontrada.")
         return
 
-    sb.table("tasks").update({"done": True}).eq("id", row[0]["id"]).execute()
-    ctx.bot_data[f"undo_{user_id}"] = {"action": "done", "row_id": row[0]["id"]}
-    await update.message.reply_text(f"✅ *{row[0]['title']}* completada.", parse_mode="Markdown")
+    _invalidate_tasks(user_id)
+    _release_id(ctx, user_id, task_id)
+    await _set_undo(user_id, {"action": "done", "row_id": res.data[0]["id"], "task_id": task_id})
+    await update.message.reply_text(f"✅ *{res.data[0]['title']}* completada.", parse_mode="Markdown")
 
 
 async def cmd_del(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
@@ -267,20 +358,21 @@ async def cmd_del(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("Uso: `/del ID`", parse_mode="Markdown")
         return
 
-    try:
-        task_id = int(ctx.args[0])
-    except ValueError:
+    task_id = _parse_id(ctx.args[0])
+    if task_id is None:
         await update.message.reply_text("ID debe ser un número.")
         return
 
-    row = sb.table("tasks").select("*").eq("user_id", user_id).eq("task_id", task_id).eq("done", False).execute().data
-    if not row:
+    # Single round-trip: the DELETE returns the removed row for the undo log.
+    res = await sb.table("tasks").delete().eq("user_id", user_id).eq("task_id", task_id).eq("done", False).execute()
+    if not res.data:
         await update.message.reply_text(f"❌ Tarea #{task_id} no encontrada.")
         return
 
-    sb.table("tasks").delete().eq("id", row[0]["id"]).execute()
-    ctx.bot_data[f"undo_{user_id}"] = {"action": "delete", "data": row[0]}
-    await update.message.reply_text(f"🗑 *{row[0]['title']}* eliminada.", parse_mode="Markdown")
+    _invalidate_tasks(user_id)
+    _release_id(ctx, user_id, task_id)
+    await _set_undo(user_id, {"action": "delete", "data": res.data[0]})
+    await update.message.reply_text(f"🗑 *{res.data[0]['title']}* eliminada.", parse_mode="Markdown")
 
 
 async def cmd_edit(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
@@ -293,20 +385,14 @@ async def cmd_edit(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    try:
-        task_id = int(ctx.args[0])
-    except ValueError:
+    task_id = _parse_id(ctx.args[0])
+    if task_id is None:
         await update.message.reply_text("ID debe ser un número.")
         return
 
     field = ctx.args[1].lower()
     value = " ".join(ctx.args[2:])
 
-    row = sb.table("tasks").select("*").eq("user_id", user_id).eq("task_id", task_id).eq("done", False).execute().data
-    if not row:
-        await update.message.reply_text(f"❌ Tarea #{task_id} no encontrada.")
-        return
-
     field_map = {
         "title": "title",
         "tag": "tag",
@@ -320,38 +406,63 @@ async def cmd_edit(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
         return
 
     db_field = field_map[field]
+
+    row = (await sb.table("tasks").select(f"id,{db_field}").eq("user_id", user_id).eq("task_id", task_id).eq("done", False).execute()).data
+    if not row:
+        await update.message.reply_text(f"❌ Tarea #{task_id} no encontrada.")
+        return
     update_data = {db_field: value.upper() if field == "tag" else value}
 
     # Store undo
-    ctx.bot_data[f"undo_{user_id}"] = {"action": "edit", "row_id": row[0]["id"], "field": db_field, "old_value": row[0][db_field]}
+    await _set_undo(user_id, {"action": "edit", "row_id": row[0]["id"], "field": db_field, "old_value": row[0][db_field]})
 
-    sb.table("tasks").update(update_data).eq("id", row[0]["id"]).execute()
+    await sb.table("tasks").update(update_data).eq("id", row[0]["id"]).execute()
+    _invalidate_tasks(user_id)
     await update.message.reply_text(f"✏️ Tarea #{task_id} actualizada: {field} → {value}")
 
 
 async def cmd_undo(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
     user_id = update.effective_user.id
-    undo = ctx.bot_data.pop(f"undo_{user_id}", None)
+    undo = await _get_undo(user_id)
     if not undo:
         await update.message.reply_text("❌ Nada que deshacer.")
         return
 
     action = undo["action"]
-    if action == "done":
-        sb.table("tasks").update({"done": False}).eq("id", undo["row_id"]).execute()
-        await update.message.reply_text("↩️ Tarea restaurada.")
-    elif action == "done_all":
-        for rid in undo["task_ids"]:
-            sb.table("tasks").update({"done": False}).eq("id", rid).execute()
-        await update.message.reply_text(f"↩️ {len(undo['task_ids'])} tareas restauradas.")
-    elif action == "delete":
-        data = undo["data"]
-        data.pop("_score", None)
-        sb.table("tasks").insert(data).execute()
-        await update.message.reply_text(f"↩️ *{data['title']}* restaurada.", parse_mode="Markdown")
-    elif action == "edit":
-        sb.table("tasks").update({undo["field"]: undo["old_value"]}).eq("id", undo["row_id"]).execute()
-        await update.message.reply_text("↩️ Edición revertida.")
+    text = None
+    try:
+        if action == "done":
+            await sb.table("tasks").update({"done": False}).eq("id", undo["row_id"]).execute()
+            _claim_id(ctx, user_id, undo["task_id"])
+            text = "↩️ Tarea restaurada."
+        elif action == "done_all":
+            await sb.table("tasks").update({"done": False}).in_("id", undo["row_ids"]).execute()
+            for tid in undo["task_ids"]:
+                _claim_id(ctx, user_id, tid)
+            text = f"↩️ {len(undo['row_ids'])} tareas restauradas."
+        elif action == "delete":
+            data = undo["data"]
+            await sb.table("tasks").insert(data).execute()
+            _claim_id(ctx, user_id, data["task_id"])
+            text = f"↩️ *{data['title']}* restaurada."
+        elif action == "edit":
+            await sb.table("tasks").update({undo["field"]: undo["old_value"]}).eq("id", undo["row_id"]).execute()
+            text = "↩️ Edición revertida."
+    except APIError as e:
+        # 23505: the restored task_id was already handed to a newer task.
+        # Keep the undo record so the user can retry after freeing the id.
+        if e.code != "23505":
+            raise
+        await update.message.reply_text(
+            "❌ No se pudo deshacer: el ID de la tarea ya está en uso por otra tarea."
+        )
+        return
+
+    # Consume the record only once the restore is in the DB.
+    _invalidate_tasks(user_id)
+    await _clear_undo(user_id)
+    if text:
+        await update.message.reply_text(text, parse_mode="Markdown")
 
 
 async def handle_message(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
@@ -366,7 +477,7 @@ async def handle_message(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("❌ La tarea necesita un título.")
         return
 
-    task_id = next_available_id(user_id)
+    task_id = await next_available_id(ctx, user_id)
 
     record = {
         "user_id": user_id,
@@ -379,10 +490,26 @@ async def handle_message(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
         "done": False,
     }
 
-    result = sb.table("tasks").insert(record).execute()
-    ctx.bot_data[f"undo_{user_id}"] = {"action": "create", "row_id": result.data[0]["id"]}
+    async def _insert_task():
+        # Runs after the confirmation is sent; the tasks_user_active unique
+        # index rejects any id the local allocator got wrong.
+        try:
+            result = await sb.table("tasks").insert(record).execute()
+        except Exception:
+            logger.exception("insert failed for user %s task %s", user_id, task_id)
+            _release_id(ctx, user_id, task_id)
+            ctx.bot_data.pop(f"used_{user_id}", None)
+            await update.message.reply_text(
+                f"⚠️ No se pudo guardar *{parsed['title']}*. Intenta de nuevo.", parse_mode="Markdown"
+            )
+            return
+        _invalidate_tasks(user_id)
+        await _set_undo(user_id, {"action": "create", "row_id": result.data[0]["id"]})
+
+    ctx.application.create_task(_insert_task(), update=update)
 
-    score = calc_total_score(parsed["tag"], parsed["priority_str"], parsed["date_str"])
+    today_ord = date.today().toordinal()
+    score = calc_total_score(parsed["tag"], parsed["priority_str"], parsed["date_str"], today_ord)
     parts = [f"✅ *#{task_id}* {parsed['title']}"]
     if parsed["tag"]:
         parts.append(f"@{parsed['tag']}")
@@ -397,6 +524,10 @@ async def handle_message(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
 
 
 async def post_init(app: Application):
+    global sb
+    # One client for the life of the process; its keep-alive pool means
+    # Supabase calls skip the TCP+TLS handshake after the first request.
+    sb = await acreate_client(SUPABASE_URL, SUPABASE_KEY)
     await app.bot.set_my_commands([
         BotCommand("show", "Ver tareas (filtros: @TAG, p PROYECTO)"),
         BotCommand("done", "Completar tarea por ID"),
@@ -419,7 +550,14 @@ def main():
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
-    app = Application.builder().token(TOKEN).post_init(post_init).build()
+    app = (
+        Application.builder()
+        .token(TOKEN)
+        .connection_pool_size(20)
+        .pool_timeout(30)
+        .post_init(post_init)
+        .build()
+    )
 
     app.add_handler(CommandHandler("start", cmd_start))
     app.add_handler(CommandHandler("help", cmd_help))
@@ -431,7 +569,7 @@ def main():
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
 
     if WEBHOOK_URL:
-        logger.info(f"Starting webhook on port {PORT}")
+        logger.info("Starting webhook on port %s", PORT)
         loop.run_until_complete(app.initialize())
         loop.run_until_complete(app.start())
         loop.run_until_complete(app.updater.start_webhook(
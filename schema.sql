@@ -0,0 +1,78 @@
+-- Supabase schema for TaskBot. Run in the SQL editor when provisioning.
+
+create table if not exists tasks (
+    -- "by default" so /undo can re-insert a deleted row with its old id
+    id bigint generated by default as identity primary key,
+    user_id bigint not null,
+    task_id int not null,
+    title text not null,
+    tag text,
+    project text,
+    priority_str text,
+    date_str text,
+    done boolean not null default false,
+    score int not null default 0
+);
+
+-- Score = tag value + priority value + date urgency, mirroring the old
+-- Python scoring. Kept on the row so /show can ORDER BY an index instead
+-- of recomputing and sorting client-side.
+create or replace function task_score(_tag text, _priority text, _date text)
+returns int language plpgsql stable as $$
+declare
+    tag_val int := case _tag when 'FGR' then 3 when 'CETS' then 3 when 'CS' then 2 else 0 end;
+    pri_val int := 0;
+    date_val int := 0;
+    due date;
+    delta int;
+begin
+    if _priority is not null then
+        pri_val := (case when left(_priority, 1) = 'U' then 1 else -1 end)
+                   + substr(_priority, 2, 1)::int;
+    end if;
+    if _date is not null then
+        begin
+            due := to_date(_date, 'DDMMYY');
+            delta := due - current_date;
+            date_val := case when delta <= 3 then 3 when delta <= 15 then 2 else 1 end;
+        exception when others then
+            date_val := 0;
+        end;
+    end if;
+    return tag_val + pri_val + date_val;
+end $$;
+
+create or replace function tasks_set_score()
+returns trigger language plpgsql as $$
+begin
+    new.score := task_score(new.tag, new.priority_str, new.date_str);
+    return new;
+end $$;
+
+drop trigger if exists tasks_score on tasks;
+create trigger tasks_score before insert or update on tasks
+for each row execute function tasks_set_score();
+
+create index if not exists tasks_score_idx on tasks (user_id, done, score desc);
+
+-- Task ids are unique per user among open tasks; completed tasks free theirs.
+-- The bot allocates ids in memory and inserts directly; this index is what
+-- rejects a duplicate if two messages race.
+create unique index if not exists tasks_user_active on tasks (user_id, task_id) where not done;
+
+-- Last undoable action per user. Kept in the DB (not bot memory) so /undo
+-- survives deploys and memory stays bounded.
+create table if not exists undo_log (
+    user_id bigint primary key,
+    payload jsonb not null,
+    created_at timestamptz not null default now()
+);
+
+-- Purge stale undo entries nightly (pg_cron):
+--   select cron.schedule('purge-undo-log', '0 1 * * *',
+--     $$delete from undo_log where created_at < now() - interval '7 days'$$);
+
+-- The date component drifts as days pass; refresh open tasks nightly
+-- (pg_cron):
+--   select cron.schedule('refresh-task-scores', '5 0 * * *',
+--     $$update tasks set score = task_score(tag, priority_str, date_str) where not done$$);